@@ -27,7 +27,6 @@ from __future__ import annotations
 import json
 from pathlib import Path
 import typer
-from . import processor
 
 app = typer.Typer(
     help="Simple ETL for CSV/JSON: clean, filter, dedupe, summarize."
@@ -46,12 +45,29 @@ def summary(input: Path):
     input : Path
         Path to the CSV or JSON file to summarize.
     """
+    from . import processor  # deferred so --help does not import pandas
+
     df = processor.load_transform(input)
     typer.echo(json.dumps(processor.summary(df), indent=2))
 
 
 @app.command()
-def convert(input: Path, output: Path):
+def convert(
+    input: Path,
+    output: Path,
+    chunksize: int = typer.Option(
+        None,
+        help="read the input in chunks of this many rows to bound memory"
+    ),
+    dask: bool = typer.Option(
+        False,
+        help="process CSV input partition-parallel with dask"
+    ),
+    pyarrow: bool = typer.Option(
+        False,
+        help="parse CSV input with the multithreaded pyarrow engine"
+    ),
+):
     """Convert CSV<->JSON without filtering.
 
     Reads the input file, normalizes columns, removes empty rows,
@@ -63,8 +79,18 @@ def convert(input: Path, output: Path):
         Input file path (.csv or .json).
     output : Path
         Output file path (.csv or .json).
+    chunksize : int, optional
+        Number of rows per chunk when streaming the input.
+    dask : bool, optional
+        Use the Dask backend (requires ``dask[dataframe]``).
+    pyarrow : bool, optional
+        Parse CSV input with the pyarrow engine (requires ``pyarrow``).
     """
-    info = processor.process(input, output)
+    from . import processor  # deferred so --help does not import pandas
+
+    info = processor.process(
+        input, output, chunksize=chunksize, use_dask=dask, use_pyarrow=pyarrow
+    )
     typer.echo(f"Saved {output}  (rows={info['rows']}, cols={info['columns']})")
 
 
@@ -80,6 +106,22 @@ def filter(
         None,
         help="comma-separated subset of columns for duplicate removal"
     ),
+    chunksize: int = typer.Option(
+        None,
+        help="read the input in chunks of this many rows to bound memory"
+    ),
+    dask: bool = typer.Option(
+        False,
+        help="process CSV input partition-parallel with dask"
+    ),
+    pyarrow: bool = typer.Option(
+        False,
+        help="parse CSV input with the multithreaded pyarrow engine"
+    ),
+    project_cols: bool = typer.Option(
+        False,
+        help="only read and output the columns used by --query and --subset"
+    ),
 ):
     """Clean, deduplicate, filter, and save data.
 
@@ -95,9 +137,28 @@ def filter(
         A pandas query string used to filter rows, e.g. ``age > 30``.
     subset : str, optional
         Comma-separated column names for deduplication, e.g. ``id,name``.
+    chunksize : int, optional
+        Number of rows per chunk when streaming the input.
+    dask : bool, optional
+        Use the Dask backend (requires ``dask[dataframe]``).
+    pyarrow : bool, optional
+        Parse CSV input with the pyarrow engine (requires ``pyarrow``).
+    project_cols : bool, optional
+        Skip all columns not referenced by ``query`` or ``subset``.
     """
+    from . import processor  # deferred so --help does not import pandas
+
     subset_cols = [s.strip() for s in subset.split(",")] if subset else None
-    info = processor.process(input, output, query=query, subset_for_dedupe=subset_cols)
+    info = processor.process(
+        input,
+        output,
+        query=query,
+        subset_for_dedupe=subset_cols,
+        chunksize=chunksize,
+        use_dask=dask,
+        project_cols=project_cols,
+        use_pyarrow=pyarrow,
+    )
     typer.echo(json.dumps(info, indent=2))
     typer.echo(f"Saved {output}")
 
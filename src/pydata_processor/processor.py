@@ -13,15 +13,311 @@ This module provides helper functions to:
 The high-level entry points are:
 
 - ``load_transform``: load + clean + filter, return DataFrame
+- ``iter_transform``: the same pipeline, yielding processed chunks
 - ``process``: load + clean + filter + write, return summary dict
 """
 
 from __future__ import annotations
+import ast
+import csv
+import importlib.util
+import itertools
+import os
 import pathlib
+import re
+from collections.abc import Iterable, Iterator
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # optional, faster JSON parser
+    orjson = None
 
-def _read(path: str | pathlib.Path) -> pd.DataFrame:
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# runs of non-alphanumeric characters, replaced by "_" in snake_case names
+_SNAKE_RE = re.compile(r"[\W_]+")
+# a name that _snake_case leaves unchanged (apart from lower-casing)
+_SNAKE_NAME_RE = re.compile(r"[^\W_]+(?:_[^\W_]+)*")
+
+# rows per batch converted to Python values by the csv.writer fast path
+_CSV_BATCH_ROWS = 100_000
+
+# rows per chunk read by ``iter_transform`` unless given
+_DEFAULT_CHUNKSIZE = 100_000
+
+# size of the CSV partitions processed in parallel by the Dask pipeline
+_DASK_BLOCKSIZE = "64MB"
+# temporary column holding the partition number of each row in that pipeline
+_PARTITION_COL = "__partition__"
+
+
+def _query_columns(
+    query: str | None, subset: list[str] | None = None
+) -> set[str] | None:
+    """Return the (cleaned) column names referenced by ``query`` and ``subset``.
+
+    Names are collected from the query's Python AST. ``None`` is returned if
+    nothing is referenced or the query uses pandas-only syntax (backticks,
+    ``@`` variables) that is not valid Python, meaning all columns are needed.
+    """
+    names = set(subset or ())
+    if query:
+        try:
+            tree = ast.parse(query, mode="eval")
+        except SyntaxError:
+            return None
+        names |= {n.id for n in ast.walk(tree) if isinstance(n, ast.Name)}
+    return names or None
+
+
+def _usecols(raw: pd.Index, columns: set[str]) -> list[str] | None:
+    """Pick the raw column names whose cleaned name is in ``columns``.
+
+    Keeps file order; returns ``None`` (read everything) if nothing matches.
+    """
+    keep = [r for r, c in zip(raw, _snake_case(raw)) if c in columns]
+    return keep or None
+
+
+def _read_csv(
+    path: pathlib.Path, engine: str | None = None, columns: set[str] | None = None
+) -> pd.DataFrame:
+    """Read a CSV file via :func:`pandas.read_csv` with the given parser engine.
+
+    If ``columns`` is given, only those columns are parsed (``usecols``).
+    With ``engine="pyarrow"`` the result is made to match the default C
+    engine (see :func:`_read_csv_pyarrow`).
+    """
+    usecols = None
+    if columns:
+        usecols = _usecols(pd.read_csv(path, nrows=0).columns, columns)
+    if engine == "pyarrow":
+        return _read_csv_pyarrow(path, usecols)
+    return pd.read_csv(path, engine=engine, usecols=usecols)
+
+
+def _read_csv_pyarrow(path: pathlib.Path, usecols: list[str] | None) -> pd.DataFrame:
+    """Parse a CSV file with the multithreaded pyarrow engine.
+
+    Input the pyarrow engine handles differently from the C engine is
+    re-read with the C engine: rows with a missing or extra field (which
+    pyarrow rejects), duplicate header names (which the C engine renames to
+    ``a.1``) and integers above the int64 range (which pyarrow turns into
+    floats). Columns pyarrow parses as dates, times or timestamps are
+    re-read as strings, as the C engine keeps them.
+    """
+    try:
+        df = pd.read_csv(path, engine="pyarrow", usecols=usecols)
+    except ValueError:  # ParserError / ArrowInvalid, e.g. on ragged rows
+        return pd.read_csv(path, usecols=usecols)
+    if df.columns.has_duplicates or any(_is_uint64(col) for _, col in df.items()):
+        return pd.read_csv(path, usecols=usecols)
+    temporal = [name for name, col in df.items() if _is_temporal(col)]
+    if temporal:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        options = pa_csv.ConvertOptions(
+            column_types=dict.fromkeys(temporal, pa.string()),
+            include_columns=temporal,
+            strings_can_be_null=True,
+            # pyarrow's defaults lack these two of pandas' missing-value markers
+            null_values=[*pa_csv.ConvertOptions().null_values, "<NA>", "None"],
+        )
+        df[temporal] = pa_csv.read_csv(path, convert_options=options).to_pandas()
+    return df
+
+
+def _is_uint64(col: pd.Series) -> bool:
+    """Tell whether ``col`` holds integers the C engine would read as uint64."""
+    if col.dtype != "float64" or col.hasnans or not len(col):
+        return False
+    values = col.to_numpy()
+    return values.max() >= 2**63 and values.min() >= 0 and (np.trunc(values) == values).all()
+
+
+def _is_temporal(col: pd.Series) -> bool:
+    """Tell whether ``col`` holds dates, times or timestamps."""
+    if col.dtype.kind in "mM":
+        return True
+    # date32 / time columns from pyarrow arrive as datetime.date / time objects
+    return col.dtype == object and pd.api.types.infer_dtype(col, skipna=True) in {
+        "date", "time", "datetime"
+    }
+
+
+def _is_json_lines(path: pathlib.Path) -> bool:
+    """Tell JSON Lines input (one object per line) from a JSON records array.
+
+    ``.jsonl`` / ``.ndjson`` files are always JSON Lines; otherwise the first
+    non-whitespace byte decides (``{`` for JSON Lines, ``[`` for an array).
+    """
+    if path.suffix.lower() in {".jsonl", ".ndjson"}:
+        return True
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(4096), b""):
+            block = block.lstrip()
+            if block:
+                return block[:1] == b"{"
+    return False
+
+
+def _read_json_lines(
+    path: pathlib.Path, chunksize: int | None = None
+) -> Iterator[pd.DataFrame]:
+    """Yield DataFrames of up to ``chunksize`` records from a JSON Lines file.
+
+    All records form a single DataFrame if ``chunksize`` is ``None``. Lines
+    are decoded one at a time with ``orjson`` when installed, otherwise via
+    :func:`pandas.read_json` with ``lines=True``. Row labels continue across
+    chunks, as with :func:`pandas.read_csv`.
+    """
+    if orjson is None:
+        if chunksize is None:
+            yield pd.read_json(path, lines=True)
+            return
+        with pd.read_json(path, lines=True, chunksize=chunksize) as reader:
+            yield from reader
+        return
+    start = 0
+    with open(path, "rb") as fh:
+        lines = (line for line in fh if line.strip())
+        while True:
+            records = [orjson.loads(line) for line in itertools.islice(lines, chunksize)]
+            if not records and start:
+                return
+            df = pd.DataFrame.from_records(records)
+            df.index = pd.RangeIndex(start, start + len(df))
+            yield df
+            start += len(df)
+            if chunksize is None or len(records) < chunksize:
+                return
+
+
+def _project(df: pd.DataFrame, columns: set[str] | None) -> pd.DataFrame:
+    """Keep only the columns whose cleaned name is in ``columns`` (if given)."""
+    if columns:
+        usecols = _usecols(df.columns, columns)
+        if usecols is not None:
+            df = df[usecols]
+    return df
+
+
+def _read_json(
+    path: pathlib.Path, engine: str | None = None, columns: set[str] | None = None
+) -> pd.DataFrame:
+    """Read a JSON records array or JSON Lines file, preferring ``orjson``.
+
+    ``engine`` only applies to CSV input and is ignored here. If ``columns``
+    is given, other columns are dropped after parsing.
+    """
+    if _is_json_lines(path):
+        df = next(_read_json_lines(path))
+    elif orjson is not None:
+        df = pd.DataFrame.from_records(orjson.loads(path.read_bytes()))
+    else:
+        df = pd.read_json(path, orient="records", lines=False)
+    return _project(df, columns)
+
+
+def _plain_csv_values(df: pd.DataFrame) -> bool:
+    """Check that ``csv.writer`` renders every value exactly like ``to_csv``.
+
+    True for frames made only of bool, integer, null-free ``float64`` and
+    null-free string columns; ``str()`` of those values matches pandas'
+    formatting, while NaN, ``<NA>``, float32, datetimes etc. are formatted
+    differently.
+    """
+    for _, col in df.items():
+        # plain numpy bool / integer columns cannot hold missing values, unlike
+        # the nullable ``Int64``, ``boolean`` and ``int64[pyarrow]`` dtypes
+        if isinstance(col.dtype, np.dtype) and col.dtype.kind in "biu":
+            continue
+        if (
+            col.dtype.kind in "biu"
+            or col.dtype == "float64"
+            or pd.api.types.is_string_dtype(col)
+        ):
+            if col.hasnans:
+                return False
+            continue
+        return False
+    return True
+
+
+def _write_csv(
+    df: pd.DataFrame,
+    path: pathlib.Path,
+    compression: str | dict = "infer",
+    append: bool = False,
+) -> None:
+    """Write a DataFrame as CSV without index, optionally appending rows.
+
+    Uncompressed frames of plain values (:func:`_plain_csv_values`) are
+    written with :func:`csv.writer` from per-column ``tolist()`` batches,
+    which skips ``to_csv``'s per-cell formatting (~1.4x faster, identical
+    output); everything else goes through ``DataFrame.to_csv``.
+    """
+    mode = "a" if append else "w"
+    if path.suffix.lower() == ".csv" and _plain_csv_values(df):
+        with open(path, mode, newline="", encoding="utf-8", buffering=8 * 1024**2) as fh:
+            writer = csv.writer(fh, lineterminator=os.linesep)
+            if not append:
+                writer.writerow(df.columns)
+            for start in range(0, len(df), _CSV_BATCH_ROWS):
+                part = df.iloc[start:start + _CSV_BATCH_ROWS]
+                writer.writerows(
+                    zip(*(part.iloc[:, i].tolist() for i in range(part.shape[1])))
+                )
+        return
+    df.to_csv(path, index=False, header=not append, mode=mode, compression=compression)
+
+
+def _write_json(df: pd.DataFrame, path: pathlib.Path) -> None:
+    """Write a DataFrame as an indented JSON list of records."""
+    # building the records list for orjson (to_dict) costs more than
+    # to_json's whole C encoder pass, so the writer stays on pandas
+    df.to_json(path, orient="records", indent=2)
+
+
+def _arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert ``object`` columns holding only strings to ``string[pyarrow]``.
+
+    pandas >= 3 already infers Arrow-backed strings when pyarrow is installed;
+    older versions return ``object`` columns, whose boxed Python ``str`` values
+    make :func:`dedupe` and :func:`filter_query` slow and memory hungry.
+    Without pyarrow the DataFrame is returned unchanged.
+    """
+    if not _HAS_PYARROW:
+        return df
+    cols = {
+        c: "string[pyarrow]"
+        for c, t in df.dtypes.items()
+        if t == object and pd.api.types.infer_dtype(df[c], skipna=True) == "string"
+    }
+    return df.astype(cols) if cols else df
+
+
+# lower-case file suffix -> reader/writer
+_JSON_SUFFIXES = {".json", ".jsonl", ".ndjson"}
+_READERS = {".csv": _read_csv, **dict.fromkeys(_JSON_SUFFIXES, _read_json)}
+_WRITERS = {".csv": _write_csv, ".json": _write_json}
+
+# fast, low compression levels for ``.csv.gz`` / ``.csv.zst`` output; gzip's
+# default level 9 costs ~2.5x the write time for ~10% smaller files
+_CSV_COMPRESSION = {
+    ".gz": {"method": "gzip", "compresslevel": 1},
+    ".zst": {"method": "zstd", "level": 1},
+}
+
+
+def _read(
+    path: str | pathlib.Path,
+    engine: str | None = None,
+    columns: set[str] | None = None,
+) -> pd.DataFrame:
     """Read a CSV or JSON file into a pandas DataFrame.
 
     Parameters
@@ -29,8 +325,17 @@ def _read(path: str | pathlib.Path) -> pd.DataFrame:
     path:
         Path to an input file. Supported extensions:
         - ``.csv``  (read via :func:`pandas.read_csv`)
-        - ``.json`` (read via :func:`pandas.read_json` with
-          ``orient='records'`` and ``lines=False``)
+        - ``.json`` (a list of records, parsed with ``orjson`` into
+          :meth:`pandas.DataFrame.from_records` if available, otherwise via
+          :func:`pandas.read_json` with ``orient='records'`` and ``lines=False``)
+        - ``.jsonl`` / ``.ndjson``, or ``.json`` files starting with ``{``
+          (JSON Lines, one record per line; see :func:`_read_json_lines`)
+    engine:
+        Optional :func:`pandas.read_csv` parser engine (``"c"``, ``"python"``
+        or ``"pyarrow"``). Defaults to the pandas default (C).
+    columns:
+        Optional set of *cleaned* column names (see :func:`clean_columns`)
+        to keep. Other CSV columns are not parsed at all.
 
     Returns
     -------
@@ -43,11 +348,76 @@ def _read(path: str | pathlib.Path) -> pd.DataFrame:
         If the file extension is not supported.
     """
     path = pathlib.Path(path)
-    if path.suffix.lower() in {".csv"}:
-        return pd.read_csv(path)
-    if path.suffix.lower() in {".json"}:
-        return pd.read_json(path, orient="records", lines=False)
-    raise ValueError(f"Unsupported input format: {path.suffix}")
+    reader = _READERS.get(path.suffix.lower())
+    if reader is None:
+        raise ValueError(f"Unsupported input format: {path.suffix}")
+    return _arrow_strings(reader(path, engine, columns))
+
+
+def _align_columns(chunk: pd.DataFrame, columns: pd.Index) -> pd.DataFrame:
+    """Conform a chunk to the columns (and column order) of the first chunk.
+
+    Columns missing from ``chunk`` are added as all-null columns. A column
+    the first chunk does not have cannot be added once output was written.
+
+    Raises
+    ------
+    ValueError
+        If ``chunk`` has columns that are not in ``columns``.
+    """
+    if chunk.columns.equals(columns):
+        return chunk
+    extra = chunk.columns.difference(columns, sort=False)
+    if len(extra):
+        raise ValueError(
+            f"Chunk has columns missing from the first chunk: {list(extra)}; "
+            "process the input without chunksize"
+        )
+    return chunk.reindex(columns=columns)
+
+
+def _read_chunks(
+    path: str | pathlib.Path, chunksize: int, columns: set[str] | None = None
+) -> Iterator[pd.DataFrame]:
+    """Read a CSV or JSON file as a sequence of DataFrame chunks.
+
+    Parameters
+    ----------
+    path:
+        Path to an input file (see :func:`_read` for supported extensions).
+    chunksize:
+        Number of rows per chunk. CSV files are streamed via
+        :func:`pandas.read_csv` with ``chunksize`` and JSON Lines files via
+        :func:`_read_json_lines`, each chunk conformed to the keys of the
+        first; JSON record arrays cannot be parsed incrementally and are
+        yielded as a single chunk.
+    columns:
+        Optional set of cleaned column names to keep (see :func:`_read`).
+
+    Yields
+    ------
+    pd.DataFrame
+        Consecutive chunks of the input file.
+    """
+    path = pathlib.Path(path)
+    if path.suffix.lower() == ".csv":
+        usecols = None
+        if columns:
+            usecols = _usecols(pd.read_csv(path, nrows=0).columns, columns)
+        with pd.read_csv(path, chunksize=chunksize, usecols=usecols) as reader:
+            for chunk in reader:
+                yield _arrow_strings(chunk)
+        return
+    if path.suffix.lower() in _JSON_SUFFIXES and _is_json_lines(path):
+        # records need not share keys or key order, unlike CSV rows
+        first = None
+        for chunk in _read_json_lines(path, chunksize):
+            chunk = _project(chunk, columns)
+            if first is None:
+                first = chunk.columns
+            yield _arrow_strings(_align_columns(chunk, first))
+        return
+    yield _read(path, columns=columns)
 
 
 def _write(df: pd.DataFrame, path: str | pathlib.Path) -> None:
@@ -59,7 +429,9 @@ def _write(df: pd.DataFrame, path: str | pathlib.Path) -> None:
         DataFrame to be written.
     path:
         Target file path. Supported extensions:
-        - ``.csv``  → ``DataFrame.to_csv(index=False)``
+        - ``.csv``  → CSV without index (:func:`_write_csv`)
+        - ``.csv.gz`` / ``.csv.zst`` → compressed CSV (gzip / zstandard at
+          level 1; zstandard requires the ``zstandard`` package)
         - ``.json`` → ``DataFrame.to_json(orient='records', indent=2)``
 
     Raises
@@ -68,13 +440,103 @@ def _write(df: pd.DataFrame, path: str | pathlib.Path) -> None:
         If the file extension is not supported.
     """
     path = pathlib.Path(path)
-    if path.suffix.lower() in {".csv"}:
-        df.to_csv(path, index=False)
-        return
-    if path.suffix.lower() in {".json"}:
-        df.to_json(path, orient="records", indent=2)
+    suffix = path.suffix.lower()
+    compression = _CSV_COMPRESSION.get(suffix)
+    if compression is not None and pathlib.Path(path.stem).suffix.lower() == ".csv":
+        _write_csv(df, path, compression)
         return
-    raise ValueError(f"Unsupported output format: {path.suffix}")
+    writer = _WRITERS.get(suffix)
+    if writer is None:
+        raise ValueError(f"Unsupported output format: {path.suffix}")
+    writer(df, path)
+
+
+def _write_chunks(chunks: Iterable[pd.DataFrame], path: str | pathlib.Path) -> dict:
+    """Write DataFrame chunks one after another and summarize all of them.
+
+    Only one chunk is held in memory at a time. CSV output (including
+    ``.csv.gz`` / ``.csv.zst``) is written with the header of the first chunk
+    and appended to afterwards; JSON chunks are spliced into a single
+    records array identical to what :func:`_write` produces. Values are
+    formatted per chunk, so a column parsed as integers in one chunk and as
+    floats in another is written as ``1`` and ``2.0`` respectively.
+
+    Parameters
+    ----------
+    chunks:
+        Iterable of DataFrames; later chunks are conformed to the columns of
+        the first (see :func:`_align_columns`).
+    path:
+        Target file path (see :func:`_write` for supported extensions).
+
+    Returns
+    -------
+    dict
+        A summary dictionary as :func:`summary` would return for the
+        concatenated chunks.
+
+    Raises
+    ------
+    ValueError
+        If the file extension is not supported, or a chunk has columns the
+        first chunk does not have.
+    """
+    path = pathlib.Path(path)
+    suffix = path.suffix.lower()
+    compression = "infer"
+    if suffix in _CSV_COMPRESSION and pathlib.Path(path.stem).suffix.lower() == ".csv":
+        compression = _CSV_COMPRESSION[suffix]
+    elif suffix not in _WRITERS:
+        raise ValueError(f"Unsupported output format: {path.suffix}")
+
+    rows = 0
+    nulls = None
+    schema = None  # empty frame carrying the combined dtypes
+    json_fh = open(path, "w", encoding="utf-8") if suffix == ".json" else None
+    try:
+        for chunk in chunks:
+            if schema is not None:
+                chunk = _align_columns(chunk, schema.columns)
+            chunk_nulls = chunk.isna().sum()
+            nulls = chunk_nulls if nulls is None else nulls.add(chunk_nulls, fill_value=0)
+            # once rows were written, chunks left empty by the filters (e.g. a
+            # chunk of all-null rows parsed as float) do not widen the dtypes
+            if rows == 0:
+                schema = chunk.head(0)
+            elif len(chunk):
+                schema = pd.concat([schema, chunk.head(0)])
+            if json_fh is not None:
+                if len(chunk):
+                    # strip the enclosing [ ] so the records join into one array
+                    body = chunk.to_json(orient="records", indent=2)[1:-1].rstrip("\n")
+                    json_fh.write(("[" if rows == 0 else ",") + body)
+            else:
+                _write_csv(chunk, path, compression, append=rows > 0)
+            rows += len(chunk)
+        if json_fh is not None:
+            json_fh.write("\n]" if rows else "[\n\n]")
+    finally:
+        if json_fh is not None:
+            json_fh.close()
+
+    if schema is None:
+        raise ValueError(f"No data to write to {path}")
+    return _summary_dict(rows, nulls, schema.dtypes)
+
+
+def _snake_case(cols: pd.Index) -> pd.Index:
+    """Convert column labels to ``snake_case`` (see :func:`clean_columns`)."""
+    # ``_SNAKE_RE`` covers whitespace, ``-``, ``/`` and any other run of
+    # non-alphanumerics (unicode letters such as ``ä`` are kept), so one regex
+    # sweep over the index replaces the per-character Python loop. The index is
+    # kept as object dtype so Python's ``re`` is used: Arrow-backed strings go
+    # through RE2, whose ``\W`` is ASCII-only.
+    return (
+        pd.Index(cols.astype(str), dtype=object)
+        .str.replace(_SNAKE_RE, "_", regex=True)
+        .str.strip("_")
+        .str.lower()
+    )
 
 
 def clean_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -96,18 +558,20 @@ def clean_columns(df: pd.DataFrame) -> pd.DataFrame:
     Returns
     -------
     pd.DataFrame
-        A copy of the original DataFrame with cleaned column names.
+        A shallow copy of the original DataFrame with cleaned column names.
+        The underlying column data is shared with ``df``, only the column
+        index is rebuilt. If all names are already clean, ``df`` itself is
+        returned.
     """
-
-    def snake(s: str) -> str:
-        s = s.strip()
-        s = s.replace("-", " ").replace("/", " ")
-        s = "".join(ch if ch.isalnum() else " " for ch in s)
-        s = "_".join(x for x in s.lower().split() if x)
-        return s
-
-    df = df.copy()
-    df.columns = [snake(c) for c in df.columns]
+    if all(
+        isinstance(c, str) and c == c.lower() and _SNAKE_NAME_RE.fullmatch(c)
+        for c in df.columns
+    ):
+        return df
+    cols = _snake_case(df.columns)
+    # only the column index changes, so a shallow copy avoids copying the data
+    df = df.copy(deep=False)
+    df.columns = cols
     return df
 
 
@@ -143,9 +607,209 @@ def dedupe(df: pd.DataFrame, subset: list[str] | None = None) -> pd.DataFrame:
     pd.DataFrame
         DataFrame with duplicate rows removed.
     """
+    # drop_duplicates is already a hash-based ``self[~self.duplicated()]``;
+    # it is kept (rather than duplicated()) since it works on Dask frames too
     return df.drop_duplicates(subset=subset)
 
 
+def _drop_null_rows_and_dedupe(
+    df: pd.DataFrame, subset: list[str] | None = None
+) -> pd.DataFrame:
+    """Combine :func:`drop_null_rows` and :func:`dedupe` into one row selection.
+
+    Both predicates are computed as boolean masks and applied together, so
+    the frame is copied once instead of twice. The result is identical to
+    ``dedupe(drop_null_rows(df), subset)``.
+
+    Parameters
+    ----------
+    df:
+        Input DataFrame.
+    subset:
+        Optional list of column names to consider for duplicate detection.
+        If ``None``, all columns are used.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame without fully-empty and duplicate rows.
+    """
+    keep = ~df.isna().all(axis=1).to_numpy()
+    if subset is None:
+        # an all-null row can only duplicate other all-null rows, which are
+        # dropped anyway, so duplicates can be detected on the full frame
+        keep &= ~df.duplicated().to_numpy()
+    else:
+        # an all-null row may share its (null) key with a kept row, so only
+        # the key columns of the remaining rows are checked
+        keys = df[subset]
+        if keep.all():
+            keep = ~keys.duplicated().to_numpy()
+        else:
+            keep[keep] = ~keys[keep].duplicated().to_numpy()
+    return df[keep]
+
+
+# hash given to missing key values of any dtype by ``_row_hashes``
+_NULL_HASH = np.uint64(2**64 - 1)
+# FNV-1a 64-bit prime, used to combine per-column hashes
+_HASH_PRIME = np.uint64(0x100000001B3)
+# booleans hash like their text, as a chunk may read them as strings
+_BOOL_HASHES = pd.util.hash_array(np.array(["False", "True"], dtype=object))
+# numbers as ``str()`` writes them; such strings are hashed as the number
+_NUMBER_TEXT = r"-?[0-9]+(?:\.[0-9]+)?(?:e[-+][0-9]+)?"
+_INT_TEXT = r"-?(?:0|[1-9][0-9]{0,17})"
+
+
+def _number_hashes(values: np.ndarray) -> np.ndarray:
+    """Hash a numeric array; integral floats hash like the equal integer."""
+    hashes = pd.util.hash_array(values)
+    if values.dtype.kind == "f":
+        with np.errstate(invalid="ignore"):
+            integral = (np.trunc(values) == values) & (np.abs(values) < 2**63)
+        hashes[integral] = pd.util.hash_array(values[integral].astype(np.int64))
+    return hashes
+
+
+def _value_hashes(col: pd.Series) -> np.ndarray:
+    """Hash the values of ``col`` independently of the dtype it was parsed as.
+
+    Chunks are parsed independently, so one column may be ``int64`` in one
+    chunk, ``float64`` (because of a NaN) in the next and ``str`` in a third
+    (because of a text value), or ``bool`` and then ``object`` (bools with
+    NaN). Numbers therefore hash by value, with strings that are exactly
+    the ``str()`` of an integer or a non-integral float hashed as that
+    number, and booleans hash like the strings ``"True"`` / ``"False"``.
+    Missing values are left to the caller.
+    """
+    if isinstance(col.dtype, np.dtype) and col.dtype.kind == "b":
+        return _BOOL_HASHES[col.to_numpy().astype(np.intp)]
+    if isinstance(col.dtype, np.dtype) and col.dtype.kind in "iuf":
+        return _number_hashes(col.to_numpy())
+
+    values = col.to_numpy(dtype=object)
+    hashes = pd.util.hash_array(values)
+    text = col
+    if col.dtype == object and pd.api.types.infer_dtype(values, skipna=True) != "string":
+        is_bool = np.array([isinstance(v, (bool, np.bool_)) for v in values], dtype=bool)
+        is_number = ~is_bool & np.array(
+            [isinstance(v, (int, float, np.number)) for v in values], dtype=bool
+        )
+        hashes[is_bool] = _BOOL_HASHES[values[is_bool].astype(np.intp)]
+        hashes[is_number] = _number_hashes(values[is_number].astype(np.float64))
+        text = pd.Series(np.where(is_bool | is_number, "", values), dtype=object)
+
+    # pd.Series.str(...) rather than ``.str``: pandas < 3 caches the accessor
+    # on the Series in a reference cycle, keeping each chunk alive until the
+    # next full garbage collection
+    numeric = np.flatnonzero(
+        pd.Series.str(text).fullmatch(_NUMBER_TEXT).to_numpy(dtype=bool, na_value=False)
+    )
+    if len(numeric):
+        strings = values[numeric]
+        is_int = pd.Series.str(pd.Series(strings, dtype=object)).fullmatch(_INT_TEXT)
+        is_int = is_int.to_numpy(dtype=bool)
+        hashes[numeric[is_int]] = pd.util.hash_array(strings[is_int].astype(np.int64))
+        # "1.0" or "2.50" keep their string hash: the in-memory pipeline reads
+        # such a column as text, where they differ from "1" and "2.5"
+        strings = strings[~is_int]
+        floats = strings.astype(np.float64)
+        canonical = (floats != np.trunc(floats)) & np.array(
+            [repr(f) == t for f, t in zip(floats.tolist(), strings)], dtype=bool
+        )
+        hashes[numeric[~is_int][canonical]] = pd.util.hash_array(floats[canonical])
+    return hashes
+
+
+def _row_hashes(keys: pd.DataFrame) -> np.ndarray:
+    """Hash every row of ``keys`` to a ``uint64`` (see :func:`_value_hashes`).
+
+    Missing values hash alike whatever their dtype.
+    """
+    hashes = np.zeros(len(keys), dtype=np.uint64)
+    for _, col in keys.items():
+        col_hashes = _value_hashes(col)
+        col_hashes[col.isna().to_numpy()] = _NULL_HASH
+        hashes = hashes * _HASH_PRIME ^ col_hashes
+    return hashes
+
+
+class _HashSet:
+    """Set of ``uint64`` hashes kept as sorted arrays, 8 bytes per entry.
+
+    New hashes are added as a sorted level; levels of similar size are
+    merged like the digits of a binary counter, so each hash is merged
+    O(log n) times and lookups binary-search O(log n) levels.
+    """
+
+    def __init__(self) -> None:
+        self._levels: list[np.ndarray] = []
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Return a boolean mask of the hashes already in the set."""
+        # sorted needles make the binary searches cache friendly
+        order = np.argsort(hashes)
+        needles = hashes[order]
+        found = np.zeros(len(hashes), dtype=bool)
+        for level in self._levels:
+            pos = np.searchsorted(level, needles)
+            pos[pos == len(level)] = 0
+            found |= level[pos] == needles
+        mask = np.empty_like(found)
+        mask[order] = found
+        return mask
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add hashes that are not yet in the set."""
+        if not len(hashes):
+            return
+        level = np.sort(hashes)
+        while self._levels and len(self._levels[-1]) < 2 * len(level):
+            level = np.sort(np.concatenate([self._levels.pop(), level]))
+        self._levels.append(level)
+
+
+def _dedupe_chunks(
+    chunks: Iterable[pd.DataFrame], subset: list[str] | None = None
+) -> Iterator[pd.DataFrame]:
+    """Remove duplicate rows across a sequence of DataFrame chunks.
+
+    Equivalent to :func:`dedupe` on the concatenated chunks. Only a 64-bit
+    hash of each unique key is kept in memory (8 bytes per key), and each
+    row is hashed once, so the run time grows linearly with the input.
+    Two distinct keys with the same hash are treated as duplicates; for
+    ``n`` unique keys this happens with probability about ``n**2 / 2**65``
+    (roughly 3e-6 for ten million keys).
+
+    Keys are compared by value whatever dtype their chunk was parsed as
+    (see :func:`_value_hashes`), so ``1``, ``1.0`` and ``"1"`` match, as do
+    ``True`` in a ``bool`` and in an ``object`` chunk. Values that a chunk
+    parsed to the same number but that are written differently in the file
+    (``1`` and ``1.0``, ``01`` and ``1``) also match, even where the
+    in-memory pipeline reads the whole column as text and keeps both.
+
+    Parameters
+    ----------
+    chunks:
+        Iterable of DataFrames sharing the same columns.
+    subset:
+        Optional list of column names to consider for duplicate detection.
+        If ``None``, all columns are used.
+
+    Yields
+    ------
+    pd.DataFrame
+        Each chunk with rows removed that duplicate an earlier row.
+    """
+    seen = _HashSet()
+    for chunk in chunks:
+        hashes = _row_hashes(chunk if subset is None else chunk[subset])
+        keep = ~pd.Series(hashes).duplicated().to_numpy()
+        keep &= ~seen.contains(hashes)
+        seen.add(hashes[keep])
+        yield chunk[keep]
+
+
 def filter_query(df: pd.DataFrame, query: str | None) -> pd.DataFrame:
     """Filter rows using a pandas-style query expression.
 
@@ -164,7 +828,8 @@ def filter_query(df: pd.DataFrame, query: str | None) -> pd.DataFrame:
     """
     if not query:
         return df
-    # pandas query syntax, e.g. 'amount > 100 and country == "DE"'
+    # pandas query syntax, e.g. 'amount > 100 and country == "DE"';
+    # evaluated with numexpr when installed, else with the python engine
     return df.query(query)
 
 
@@ -189,18 +854,141 @@ def summary(df: pd.DataFrame) -> dict:
         A JSON-serializable dictionary with keys ``rows``, ``columns``,
         ``nulls`` and ``dtypes``.
     """
+    # one vectorized reduction over all columns instead of per-column df[c]
+    return _summary_dict(len(df), df.isna().sum(), df.dtypes)
+
+
+def _summary_dict(rows: int, nulls: pd.Series, dtypes: pd.Series) -> dict:
+    """Build the :func:`summary` dictionary from precomputed parts."""
     return {
-        "rows": int(len(df)),
-        "columns": int(df.shape[1]),
-        "nulls": {c: int(df[c].isna().sum()) for c in df.columns},
-        "dtypes": {c: str(df[c].dtype) for c in df.columns},
+        "rows": int(rows),
+        "columns": int(len(dtypes)),
+        "nulls": {c: int(v) for c, v in nulls.items()},
+        "dtypes": {c: str(v) for c, v in dtypes.items()},
     }
 
 
+def _load_transform_dask(
+    input_path: str | pathlib.Path,
+    query: str | None = None,
+    subset_for_dedupe: list[str] | None = None,
+    columns: set[str] | None = None,
+) -> pd.DataFrame:
+    """Run the :func:`load_transform` pipeline on a Dask DataFrame.
+
+    The CSV is split into ~64 MB partitions which are cleaned, de-duplicated
+    and filtered in parallel; only the result is materialized in memory.
+    Rows come back in file order, labelled with their row number in the
+    file as for the in-memory pipeline. Requires the optional
+    ``dask[dataframe]`` package.
+
+    Parameters
+    ----------
+    input_path:
+        Path to the input CSV file.
+    query:
+        Optional pandas-style query string applied after cleaning/deduplication.
+    subset_for_dedupe:
+        Optional list of column names for duplicate detection.
+    columns:
+        Optional set of cleaned column names to read (see :func:`_read`).
+
+    Returns
+    -------
+    pd.DataFrame
+        The computed, fully processed DataFrame.
+
+    Raises
+    ------
+    ValueError
+        If the input is not a CSV file.
+    """
+    path = pathlib.Path(input_path)
+    if path.suffix.lower() != ".csv":
+        raise ValueError(f"Unsupported input format for dask: {path.suffix}")
+    import dask
+    import dask.dataframe as dd
+
+    usecols = None
+    if columns:
+        usecols = _usecols(pd.read_csv(path, nrows=0).columns, columns)
+    raw = dd.read_csv(path, blocksize=_DASK_BLOCKSIZE, usecols=usecols)
+    df = drop_null_rows(clean_columns(raw))
+    # every partition is labelled from 0, so rows are tagged with their
+    # partition to rebuild the file row numbers once partition lengths are known
+    subset = subset_for_dedupe or list(df.columns)
+    df = df.map_partitions(_tag_partition)
+    # a single output partition keeps the first occurrence in file order,
+    # unlike the shuffle used for split_out > 1
+    df = df.drop_duplicates(subset=subset, split_out=1)
+    df = filter_query(df, query)
+    result, lengths = dask.compute(df, raw.map_partitions(len))
+
+    offsets = np.concatenate([[0], np.cumsum(np.asarray(lengths))[:-1]])
+    partition = result.pop(_PARTITION_COL).to_numpy()
+    result.index = pd.Index(offsets[partition] + result.index.to_numpy())
+    return result.sort_index()
+
+
+def _tag_partition(df: pd.DataFrame, partition_info: dict | None = None) -> pd.DataFrame:
+    """Add the Dask partition number of each row as ``_PARTITION_COL``."""
+    number = partition_info["number"] if partition_info else 0
+    return df.assign(**{_PARTITION_COL: number})
+
+
+def iter_transform(
+    input_path: str | pathlib.Path,
+    query: str | None = None,
+    subset_for_dedupe: list[str] | None = None,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+    project_cols: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """Run the :func:`load_transform` pipeline chunk by chunk.
+
+    The input is read in chunks (:func:`_read_chunks`); each chunk is cleaned,
+    stripped of empty rows, de-duplicated against all earlier rows and
+    filtered before it is yielded, so callers can process or write results
+    while only one raw chunk (plus a hash of each unique key) is held in
+    memory. Concatenating the chunks gives the same rows as the in-memory
+    pipeline, up to the corner cases of :func:`_dedupe_chunks`, but dtypes
+    are inferred per chunk: a column that is empty in one chunk, or
+    integral in one and fractional in another, may come back as ``object``
+    or with ``1`` next to ``2.0``.
+
+    Parameters
+    ----------
+    input_path:
+        Path to the input file (CSV or JSON).
+    query:
+        Optional pandas-style query string applied after cleaning/deduplication.
+    subset_for_dedupe:
+        Optional list of column names for duplicate detection.
+    chunksize:
+        Number of rows per chunk.
+    project_cols:
+        Only read the columns referenced by ``query`` and
+        ``subset_for_dedupe`` (see :func:`load_transform`).
+
+    Yields
+    ------
+    pd.DataFrame
+        Processed chunks; some may be empty.
+    """
+    columns = _query_columns(query, subset_for_dedupe) if project_cols else None
+    chunks = _read_chunks(input_path, chunksize, columns)
+    chunks = (drop_null_rows(clean_columns(c)) for c in chunks)
+    for chunk in _dedupe_chunks(chunks, subset_for_dedupe):
+        yield filter_query(chunk, query)
+
+
 def load_transform(
     input_path: str | pathlib.Path,
     query: str | None = None,
     subset_for_dedupe: list[str] | None = None,
+    chunksize: int | None = None,
+    use_dask: bool = False,
+    project_cols: bool = False,
+    use_pyarrow: bool = False,
 ) -> pd.DataFrame:
     """Load, clean, deduplicate and optionally filter a dataset.
 
@@ -220,16 +1008,45 @@ def load_transform(
         Optional pandas-style query string applied after cleaning/deduplication.
     subset_for_dedupe:
         Optional list of column names for duplicate detection.
+    chunksize:
+        Optional number of rows per chunk. If given, the input is read and
+        transformed chunk by chunk (:func:`iter_transform`), so only one raw
+        chunk plus the already processed rows are held in memory. Dtypes are
+        inferred per chunk, so a column may come back with another dtype or
+        value formatting than in memory (``object`` for a column that is
+        empty in one chunk, ``120`` next to ``120.0``).
+    use_dask:
+        Run the pipeline partition-parallel with Dask
+        (:func:`_load_transform_dask`, CSV only). Takes precedence over
+        ``chunksize``.
+    project_cols:
+        Only read the columns referenced by ``query`` and
+        ``subset_for_dedupe``; all other CSV columns are skipped while
+        parsing. This changes the output schema, and without a
+        ``subset_for_dedupe`` duplicates are detected on the kept columns only.
+    use_pyarrow:
+        Parse CSV input with the multithreaded ``pyarrow`` engine (requires
+        pyarrow; see :func:`_read_csv_pyarrow`). Only applies to the
+        in-memory pipeline; ``chunksize`` and ``use_dask`` read with the C
+        engine.
 
     Returns
     -------
     pd.DataFrame
         The fully processed DataFrame.
     """
-    df = _read(input_path)
+    if chunksize and not use_dask:
+        return pd.concat(
+            iter_transform(input_path, query, subset_for_dedupe, chunksize, project_cols)
+        )
+
+    columns = _query_columns(query, subset_for_dedupe) if project_cols else None
+    if use_dask:
+        return _load_transform_dask(input_path, query, subset_for_dedupe, columns)
+
+    df = _read(input_path, "pyarrow" if use_pyarrow else None, columns)
     df = clean_columns(df)
-    df = drop_null_rows(df)
-    df = dedupe(df, subset_for_dedupe)
+    df = _drop_null_rows_and_dedupe(df, subset_for_dedupe)
     df = filter_query(df, query)
     return df
 
@@ -239,6 +1056,10 @@ def process(
     output_path: str | pathlib.Path,
     query: str | None = None,
     subset_for_dedupe: list[str] | None = None,
+    chunksize: int | None = None,
+    use_dask: bool = False,
+    project_cols: bool = False,
+    use_pyarrow: bool = False,
 ) -> dict:
     """End-to-end processing pipeline: load, transform and write to disk.
 
@@ -261,12 +1082,41 @@ def process(
         Optional pandas-style query string for row filtering.
     subset_for_dedupe:
         Optional list of column names used for duplicate detection.
+    chunksize:
+        Optional number of rows per chunk for streaming the input
+        (see :func:`load_transform`). Chunks are written to ``output_path``
+        as they are produced (:func:`_write_chunks`) instead of being
+        collected first.
+    use_dask:
+        Process a CSV input partition-parallel with Dask
+        (see :func:`load_transform`).
+    project_cols:
+        Only keep the columns referenced by ``query`` and
+        ``subset_for_dedupe`` (see :func:`load_transform`).
+    use_pyarrow:
+        Parse CSV input with the ``pyarrow`` engine
+        (see :func:`load_transform`).
 
     Returns
     -------
     dict
         A summary dictionary as returned by :func:`summary`.
     """
-    df = load_transform(input_path, query, subset_for_dedupe)
+    # large inputs are not switched to chunks by size: the chunked pipeline
+    # infers dtypes per chunk and may format the output differently
+    if chunksize and not use_dask:
+        chunks = iter_transform(
+            input_path, query, subset_for_dedupe, chunksize, project_cols
+        )
+        return _write_chunks(chunks, output_path)
+
+    df = load_transform(
+        input_path,
+        query,
+        subset_for_dedupe,
+        use_dask=use_dask,
+        project_cols=project_cols,
+        use_pyarrow=use_pyarrow,
+    )
     _write(df, output_path)
     return summary(df)
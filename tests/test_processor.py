@@ -1,5 +1,6 @@
 from pathlib import Path
 import pandas as pd
+import pytest
 from pydata_processor import processor
 
 def test_clean_and_summary(tmp_path: Path):
@@ -15,3 +16,289 @@ def test_clean_and_summary(tmp_path: Path):
     assert info["rows"] == 2
     assert "name" in info["dtypes"]
     assert out.exists()
+
+
+def test_clean_columns_snake_case():
+    df = pd.DataFrame(columns=[" First Name ", "Amount (€)", "zip-code/area", "Größe", "already_snake"])
+    out = processor.clean_columns(df)
+    assert list(out.columns) == ["first_name", "amount", "zip_code_area", "größe", "already_snake"]
+    # input frame is left untouched
+    assert list(df.columns)[0] == " First Name "
+
+
+def test_chunked_matches_in_memory(tmp_path: Path):
+    df = pd.DataFrame({"Name": ["Alice", "Alice", "Bob", None, "Carla", "Bob"],
+                       "Amount": [10, 200, 150, None, 300, 120]})
+    p = tmp_path / "in.csv"
+    df.to_csv(p, index=False)
+
+    kwargs = dict(query="amount > 100", subset_for_dedupe=["name"])
+    expected = processor.load_transform(p, **kwargs)
+    chunked = processor.load_transform(p, chunksize=2, **kwargs)
+
+    pd.testing.assert_frame_equal(chunked, expected)
+    assert chunked["name"].tolist() == ["Bob", "Carla"]
+
+
+def test_json_roundtrip(tmp_path: Path):
+    p = tmp_path / "in.json"
+    p.write_text('[{"Name": "Alice", "Amount": 120.5}, {"Name": "Bob", "Amount": null}]')
+
+    out = tmp_path / "out.json"
+    info = processor.process(p, out)
+
+    assert info["rows"] == 2
+    assert info["nulls"] == {"name": 0, "amount": 1}
+    back = processor.load_transform(out)
+    assert back["amount"].tolist()[0] == 120.5
+
+
+def test_pyarrow_dates_stay_strings(tmp_path: Path):
+    pytest.importorskip("pyarrow")
+    p = tmp_path / "in.csv"
+    p.write_text("Name,Date,Seen\n"
+                 "Alice,2024-01-05,2024-01-05 10:00:00\n"
+                 "Bob,2024-01-15,\n"
+                 "Carla,2024-01-08,2024-01-08T09:30:00\n")
+
+    out = tmp_path / "out.json"
+    info = processor.process(p, out, query='date > "2024-01-10"', use_pyarrow=True)
+    df = processor.load_transform(p, use_pyarrow=True)
+
+    assert info["rows"] == 1
+    assert '"date":"2024-01-15"' in out.read_text().replace(" ", "")
+    assert df["seen"].tolist()[::2] == ["2024-01-05 10:00:00", "2024-01-08T09:30:00"]
+    pd.testing.assert_frame_equal(df, processor.load_transform(p))
+    pd.testing.assert_frame_equal(df, processor.load_transform(p, chunksize=2))
+
+
+@pytest.mark.parametrize("text", [
+    "name,amount,note\nA,1\nB,2,x\n",  # missing field
+    "name,amount\nA,1,\nB,2\n",  # trailing comma
+    "a,a\n1,2\n",  # duplicate header
+    "d,d\n2024-01-05,2024-01-06\n",  # duplicate date header
+    "id\n18446744073709551615\n1\n",  # uint64
+])
+def test_pyarrow_engine_matches_c_engine(tmp_path: Path, text):
+    pytest.importorskip("pyarrow")
+    p = tmp_path / "in.csv"
+    p.write_text(text)
+
+    expected = processor._read_csv(p)
+    pd.testing.assert_frame_equal(processor._read_csv(p, "pyarrow"), expected)
+
+
+def test_dask_matches_in_memory(tmp_path: Path):
+    pytest.importorskip("dask.dataframe")
+    df = pd.DataFrame({"Name": ["Alice", "Alice", "Bob", None, "Carla"],
+                       "Amount": [10, 200, 150, None, 300]})
+    p = tmp_path / "in.csv"
+    df.to_csv(p, index=False)
+
+    kwargs = dict(query="amount > 100", subset_for_dedupe=["name"])
+    expected = processor.load_transform(p, **kwargs)
+    result = processor.load_transform(p, use_dask=True, **kwargs)
+
+    assert result["name"].tolist() == expected["name"].tolist()
+    assert result["amount"].tolist() == expected["amount"].tolist()
+
+
+def test_dask_partitions_keep_row_order(tmp_path: Path, monkeypatch):
+    pytest.importorskip("dask.dataframe")
+    df = pd.DataFrame({"Name": [f"n{i % 7}" for i in range(60)],
+                       "Amount": [i % 11 for i in range(60)]})
+    df.loc[[5, 33]] = None
+    p = tmp_path / "in.csv"
+    df.to_csv(p, index=False)
+    monkeypatch.setattr(processor, "_DASK_BLOCKSIZE", 100)
+
+    for kwargs in ({}, dict(subset_for_dedupe=["name"]), dict(query="amount > 3")):
+        expected = processor.load_transform(p, **kwargs)
+        result = processor.load_transform(p, use_dask=True, **kwargs)
+
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_null_key_row_survives_dedupe(tmp_path: Path):
+    # the all-empty row is dropped before deduplication, so the row with a
+    # missing name is not treated as its duplicate
+    df = pd.DataFrame({"Name": [None, None, "Bob"], "Amount": [None, 5, 7]})
+    p = tmp_path / "in.csv"
+    df.to_csv(p, index=False)
+
+    out = processor.load_transform(p, subset_for_dedupe=["name"])
+
+    assert out["amount"].tolist() == [5, 7]
+
+
+def test_project_cols_reads_only_referenced_columns(tmp_path: Path):
+    df = pd.DataFrame({"Name": ["Alice", "Alice", "Bob"],
+                       "Country": ["DE", "DE", "US"],
+                       "Amount (€)": [120, 130, 90],
+                       "Note": ["x", "y", "z"]})
+    p = tmp_path / "in.csv"
+    df.to_csv(p, index=False)
+
+    kwargs = dict(query="amount > 100", subset_for_dedupe=["name"], project_cols=True)
+    out = processor.load_transform(p, **kwargs)
+    chunked = processor.load_transform(p, chunksize=2, **kwargs)
+
+    assert list(out.columns) == ["name", "amount"]
+    assert out["amount"].tolist() == [120]
+    pd.testing.assert_frame_equal(chunked, out)
+
+
+def test_write_gzip_csv(tmp_path: Path):
+    p = tmp_path / "in.csv"
+    pd.DataFrame({"Name": ["Alice", "Bob"], "Amount": [120, 90]}).to_csv(p, index=False)
+
+    out = tmp_path / "out.csv.gz"
+    processor.process(p, out)
+
+    assert pd.read_csv(out)["amount"].tolist() == [120, 90]
+
+
+def test_streamed_output_matches_in_memory(tmp_path: Path):
+    df = pd.DataFrame({"Name": ["Alice", "Alice", "Bob", "Eve", "Carla", "Dan"],
+                       "Qty": [1, 2, 3, 4, 5, 6],
+                       "Amount": [10.5, 200, 150.5, 120, 300.5, 99.5]})
+    p = tmp_path / "in.csv"
+    df.to_csv(p, index=False)
+
+    for suffix in (".csv", ".json"):
+        expected, streamed = tmp_path / f"mem{suffix}", tmp_path / f"chunked{suffix}"
+        kwargs = dict(query="amount > 100", subset_for_dedupe=["name"])
+        info = processor.process(p, expected, **kwargs)
+        chunked_info = processor.process(p, streamed, chunksize=2, **kwargs)
+
+        assert chunked_info == info
+        assert streamed.read_text() == expected.read_text()
+
+
+def test_iter_transform_yields_chunks(tmp_path: Path):
+    p = tmp_path / "in.csv"
+    pd.DataFrame({"Name": list("abcde"), "Amount": range(5)}).to_csv(p, index=False)
+
+    chunks = list(processor.iter_transform(p, chunksize=2))
+
+    assert [len(c) for c in chunks] == [2, 2, 1]
+
+
+def test_dedupe_chunks_matches_drop_duplicates():
+    # the same key parsed as int in one chunk and float (with NaN) in another
+    chunks = [pd.DataFrame({"x": [1, 2, 2], "s": ["a", None, None]}),
+              pd.DataFrame({"x": [1.0, None, 2.5], "s": ["a", "b", None]}),
+              # chunks that bring no new keys
+              pd.DataFrame({"x": [1, 2], "s": ["a", None]}),
+              pd.DataFrame({"x": [], "s": []}),
+              pd.DataFrame({"x": [None, 3.0, 1.0], "s": ["b", "c", "b"]})]
+
+    out = pd.concat(processor._dedupe_chunks(chunks))
+    expected = pd.concat(chunks).drop_duplicates()
+
+    assert out.index.tolist() == expected.index.tolist()
+    assert out["x"].tolist() == pytest.approx(expected["x"].tolist(), nan_ok=True)
+
+
+@pytest.mark.parametrize("text, subset", [
+    ("flag,name\nTrue,a\nFalse,b\nTrue,c\n,d\n", ["flag"]),  # bool, then object
+    ("k\n1\n2\n1\nx\n", None),  # int64, then str
+    ("k\n0.5\n\n0.5\nx\n", None),  # float64, then str
+])
+def test_chunked_dedupe_across_dtype_drift(tmp_path: Path, text, subset):
+    p = tmp_path / "in.csv"
+    p.write_text(text)
+
+    expected = processor.load_transform(p, subset_for_dedupe=subset)
+    chunked = processor.load_transform(p, subset_for_dedupe=subset, chunksize=2)
+
+    assert chunked.index.tolist() == expected.index.tolist()
+
+
+def test_dedupe_chunks_keeps_only_key_hashes():
+    import tracemalloc
+
+    def chunks():
+        for i in range(20):
+            ids = range(i * 10_000, (i + 1) * 10_000)
+            text = pd.Series([f"{n:0>200}" for n in ids], dtype=object)
+            yield pd.DataFrame({"id": ids, "text": text})
+
+    tracemalloc.start()
+    for _ in processor._dedupe_chunks(chunks()):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # the 200k unique rows hold ~50 MB of text; their hashes take 1.6 MB
+    assert peak < 20 * 1024**2
+
+
+def test_clean_columns_skips_clean_names():
+    df = pd.DataFrame(columns=["name", "amount_eur", "größe", "col2"])
+    assert processor.clean_columns(df) is df
+
+    for dirty in ("Name", "a__b", "_a", "a-b"):
+        assert processor.clean_columns(pd.DataFrame(columns=[dirty])).columns[0] != dirty
+
+
+def test_csv_fast_path_matches_to_csv(tmp_path: Path):
+    df = pd.DataFrame({"id": [1, 2, 3], "amount": [0.1, 1e20, -2.5],
+                       "note": ['say "hi"', "a,b", "multi\nline"], "ok": [True, False, True]})
+    expected, written = tmp_path / "expected.csv", tmp_path / "written.csv"
+    df.to_csv(expected, index=False)
+
+    assert processor._plain_csv_values(df)
+    processor._write(df, written)
+
+    assert written.read_bytes() == expected.read_bytes()
+
+
+def test_csv_fast_path_skips_nullable_na(tmp_path: Path):
+    df = pd.DataFrame({"id": pd.array([1, None, 3], dtype="Int64"),
+                       "ok": pd.array([True, None, False], dtype="boolean")})
+    expected, written = tmp_path / "expected.csv", tmp_path / "written.csv"
+    df.to_csv(expected, index=False)
+
+    assert not processor._plain_csv_values(df)
+    assert processor._plain_csv_values(df.dropna())
+    processor._write(df, written)
+
+    assert written.read_bytes() == expected.read_bytes()
+
+
+def test_json_lines_input(tmp_path: Path):
+    p = tmp_path / "in.json"
+    p.write_text('{"Name": "Alice", "Amount": 120}\n'
+                 '{"Name": "Alice", "Amount": 130}\n'
+                 '{"Name": "Bob", "Amount": 90}\n\n'
+                 '{"Name": "Carla", "Amount": 300}\n')
+
+    kwargs = dict(query="amount > 100", subset_for_dedupe=["name"])
+    expected = processor.load_transform(p, **kwargs)
+    chunked = processor.load_transform(p, chunksize=2, **kwargs)
+
+    assert expected["name"].tolist() == ["Alice", "Carla"]
+    pd.testing.assert_frame_equal(chunked, expected)
+
+
+def test_json_lines_chunks_with_reordered_and_missing_keys(tmp_path: Path):
+    p = tmp_path / "in.jsonl"
+    p.write_text('{"Name": "Alice", "Amount": 120}\n'
+                 '{"Amount": 130, "Name": "Bob"}\n'
+                 '{"Name": "Carla"}\n')
+    out = tmp_path / "out.csv"
+
+    info = processor.process(p, out, chunksize=1)
+
+    assert info["nulls"] == {"name": 0, "amount": 1}
+    assert out.read_text().splitlines() == ["name,amount", "Alice,120", "Bob,130", "Carla,"]
+
+
+def test_json_lines_chunks_with_extra_keys(tmp_path: Path):
+    p = tmp_path / "in.jsonl"
+    p.write_text('{"Name": "Alice", "Amount": 120}\n'
+                 '{"Name": "Bob", "Amount": 90, "Note": "late"}\n')
+
+    with pytest.raises(ValueError, match="note|Note"):
+        processor.process(p, tmp_path / "out.csv", chunksize=1)